@@ -59,6 +59,9 @@ async function runSprintManager(args) {
             const proc = (0, child_process_1.spawn)(pythonPath, [scriptPath, ...args], { cwd });
             let stdout = '';
             let stderr = '';
+            // Decode as a stream so multi-byte UTF-8 characters split across chunks survive
+            proc.stdout.setEncoding('utf8');
+            proc.stderr.setEncoding('utf8');
             proc.stdout.on('data', data => { stdout += data.toString(); });
             proc.stderr.on('data', data => { stderr += data.toString(); });
             proc.on('close', code => {
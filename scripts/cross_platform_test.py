@@ -40,8 +40,19 @@ def create_test_sprint_file():
     """Creates a test sprint file for testing"""
     file_path = get_test_file_path()
     
-    with open(file_path, 'w') as f:
-        json.dump(TEST_TASKS, f, indent=2)
+    data = json.dumps(TEST_TASKS, indent=2).encode('utf-8')
+    
+    # Leave the file alone if it already holds exactly these tasks
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                print(f"Test sprint file is up to date: {file_path}")
+                return file_path
+    except FileNotFoundError:
+        pass
+    
+    with open(file_path, 'wb') as f:
+        f.write(data)
     
     print(f"Created test sprint file at: {file_path}")
     return file_path
@@ -68,19 +79,20 @@ def main():
     
     # Create test sprint file
     test_file = create_test_sprint_file()
-    print(f"\nTest sprint file created at: {test_file}")
-    print("\nPlease perform the following manual tests:")
-    
+    print(f"\nTest sprint file: {test_file}")
     # Manual test instructions
-    print("\n1. Open VS Code with the Arcano extension installed")
-    print("2. Open the Arcano panel (via command or icon)")
-    print("3. Select the test-sprint.json file from the dropdown")
-    print("4. Verify tasks are displayed correctly")
-    print("5. Test the 'Plan' button on one of the tasks")
-    print("6. Verify GitHub Copilot Chat opens with the correct prompt")
-    print("7. Test the 'Code' button on another task")
-    print("8. Verify GitHub Copilot Chat opens with the correct prompt")
-    print("9. Mark a task as done and verify the change is saved")
+    print("""
+Please perform the following manual tests:
+
+1. Open VS Code with the Arcano extension installed
+2. Open the Arcano panel (via command or icon)
+3. Select the test-sprint.json file from the dropdown
+4. Verify tasks are displayed correctly
+5. Test the 'Plan' button on one of the tasks
+6. Verify GitHub Copilot Chat opens with the correct prompt
+7. Test the 'Code' button on another task
+8. Verify GitHub Copilot Chat opens with the correct prompt
+9. Mark a task as done and verify the change is saved""")
     
     print("\n===== Test Complete =====")
     print(f"Please document your findings in the test report.")
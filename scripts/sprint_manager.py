@@ -1,20 +1,48 @@
-import argparse
 import json
 import os
 import re
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 
-if hasattr(sys.stdout, "reconfigure"):
-    if sys.stdout.encoding.lower() != "utf-8":
+# orjson is optional; when installed it replaces the stdlib encoder/decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only Windows consoles/pipes default to a legacy code page; elsewhere stdout
+# is already UTF-8 (PEP 538/540), so skip the check entirely
+if sys.platform == 'win32' and hasattr(sys.stdout, "reconfigure"):
+    if (sys.stdout.encoding or '').lower() != "utf-8":
         sys.stdout.reconfigure(encoding="utf-8") # type: ignore
 
 # Debug mode flag
 DEBUG_MODE = os.environ.get('ARCANO_DEBUG', '0') == '1'
 DEBUG_LEVEL = os.environ.get('ARCANO_DEBUG_LEVEL', 'normal')
 
-# Dummy task list for demonstration
-arcano_tasks = [
+# Task files live in docs/ under the directory the script is run from
+DOCS_PATH = os.path.join(os.getcwd(), 'docs')
+
+# JSON task files tried by name before the rest of docs/ is scanned
+PREFERRED_JSON_FILES = ('sprint.json', 'tasks.json')
+
+# sprint.json is written compactly unless pretty output is requested (--pretty)
+PRETTY_JSON = os.environ.get('ARCANO_PRETTY_JSON', '0') == '1'
+
+# Classifies a raw markdown line in one match: either a ##/### section header
+# (level, sec) or a checkbox task (done, task), ignoring surrounding space;
+# names must start with a non-space so blank headers and checkboxes are skipped
+_MD_DISPATCH = re.compile(
+    r'\s*(?:(?P<level>###?)\s+(?P<sec>\S.*?)|-\s*\[(?P<done>[ x])\]\s*(?P<task>\S.*?))\s*$'
+)
+
+# A checkbox task line: indentation, mark and task text (trailing space ignored);
+# accepts the same spacing as _MD_DISPATCH so every loaded task can be written back
+_TASK_LINE_RE = re.compile(r'(\s*)-\s*\[([ x])\]\s*(\S.*?)\s*$')
+
+# Dummy task list for demonstration, used when docs/ has no task file
+DEFAULT_TASKS = [
     {"task": "Automated Debug System (Highest Priority)", "done": False},
     {"task": "Develop advanced deck sharing & privacy features", "done": False},
     {"task": "Implement lazy loading for media assets", "done": False},
@@ -32,94 +60,278 @@ def debug_log(message, level='normal'):
     if DEBUG_MODE and (DEBUG_LEVEL == 'verbose' or level == 'normal'):
         print(f"🐛 DEBUG: {message}", flush=True)
 
+def _json_loads(data):
+    """Decode JSON from UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, pretty=False):
+    """Encode obj as UTF-8 JSON bytes, compact unless pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def set_docs_path(path):
+    """Point the script at a different docs directory (used by tests)."""
+    global DOCS_PATH, _tasks_cache
+    DOCS_PATH = path
+    # Tasks loaded from the old directory no longer apply
+    _tasks_cache = None
+
+def _parse_json_tasks(raw):
+    """Return the task list encoded in raw JSON bytes, or None if it isn't one."""
+    # A task file is a JSON array; reject anything else before parsing it.
+    # Only the slice is stripped, so the whole buffer is never copied
+    if raw[:4096].lstrip()[:1] != b'[':
+        return None
+    data = _json_loads(raw)
+    # Task files are homogeneous, so checking the first entry is enough
+    if isinstance(data, list) and (not data or (isinstance(data[0], dict) and 'task' in data[0])):
+        return data
+    return None
+
+def _read_json_tasks(file_path):
+    """Return the task list stored in a JSON file, or None if it isn't one."""
+    try:
+        # One binary read hands the raw bytes to the decoder without a str copy
+        with open(file_path, 'rb') as f:
+            return _parse_json_tasks(f.read())
+    except Exception as e:
+        debug_log(f"Error reading {file_path}: {e}", level='verbose')
+    return None
+
+def _parse_markdown_tasks(file_path):
+    """Parse section headers and checkbox tasks from a markdown file."""
+    items = []
+    current_section = None
+    # Iterate the file object so only one line is held in memory at a time
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = _MD_DISPATCH.match(line)
+            if match is None:
+                continue
+            if match['level']:
+                current_section = match['sec']
+                # Add section with flag indicating if it's a header (##) or task group (###)
+                items.append({
+                    "type": "section",
+                    "name": current_section,
+                    "isHeader": match['level'] == "##"  # True for ##, False for ###
+                })
+            else:
+                items.append({
+                    "type": "task",
+                    "task": match['task'],
+                    "done": match['done'] == 'x',
+                    "section": current_section
+                })
+    return items
+
 def load_tasks_from_any_json_or_md():
     debug_log("Looking for task files...")
-    docs_path = os.path.join(os.getcwd(), 'docs')
-    # Scan all .json files in docs
-    if os.path.exists(docs_path):
-        json_files = [f for f in os.listdir(docs_path) if f.endswith('.json')]
-        debug_log(f"Found JSON files: {json_files}")
-        
-        for json_file in json_files:
-            file_path = os.path.join(docs_path, json_file)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list) and all('task' in item for item in data):
-                        debug_log(f"Loaded tasks from {json_file}")
-                        return data
-            except Exception as e:
-                debug_log(f"Error reading {json_file}: {e}", level='verbose')
-        
+    
+    # Tasks are saved to sprint.json, so try the conventional names before
+    # parsing whatever other JSON happens to live in docs/
+    for name in PREFERRED_JSON_FILES:
+        file_path = os.path.join(DOCS_PATH, name)
+        if os.path.isfile(file_path):
+            data = _read_json_tasks(file_path)
+            if data is not None:
+                debug_log(f"Loaded tasks from {name}")
+                return data
+    
+    # Classify the docs entries in a single directory pass
+    try:
+        it = os.scandir(DOCS_PATH)
+    except FileNotFoundError:
+        debug_log("No task files found, using default tasks")
+        return None
+    
+    json_files = []
+    md_files = {}
+    with it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            if name.endswith('.json'):
+                # Preferred files were already tried; empty files can't hold tasks
+                if name not in PREFERRED_JSON_FILES and entry.stat().st_size > 0:
+                    json_files.append(entry)
+            elif name == 'sprint.md' or name == 'todo.md':
+                md_files[name] = entry.path
+    debug_log(f"Found JSON files: {[entry.name for entry in json_files]}")
+    
+    for entry in json_files:
+        data = _read_json_tasks(entry.path)
+        if data is not None:
+            debug_log(f"Loaded tasks from {entry.name}")
+            return data
+    
     # Try sprint.md or todo.md as fallback
-    for md_file in [os.path.join(docs_path, 'sprint.md'), os.path.join(docs_path, 'todo.md')]:
-        if os.path.exists(md_file):
+    for md_file in [md_files.get('sprint.md'), md_files.get('todo.md')]:
+        if md_file:
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tasks = []
-                    for line in content.splitlines():
-                        match = re.search(r'- \[([ x])\] (.*)', line)
-                        if match:
-                            done = match.group(1) == 'x'
-                            task_text = match.group(2)
-                            tasks.append({"task": task_text, "done": done})
-                    if tasks:
-                        debug_log(f"Loaded tasks from {md_file}")
-                        return tasks
+                tasks = [item for item in _parse_markdown_tasks(md_file) if item['type'] == 'task']
+                if tasks:
+                    debug_log(f"Loaded tasks from {md_file}")
+                    return tasks
             except Exception as e:
                 debug_log(f"Error reading {md_file}: {e}", level='verbose')
     
     debug_log("No task files found, using default tasks")
     return None
 
+def _temp_file_beside(path):
+    """Create a temporary file in path's directory; returns (fd, tmp_path)."""
+    import tempfile
+    directory, name = os.path.split(path)
+    return tempfile.mkstemp(dir=directory, prefix=f'.{name}.', suffix='.tmp')
+
+def _replace_with_temp(tmp_path, path):
+    """Atomically move a finished temporary file over path."""
+    # mkstemp creates the file owner-only; keep the mode of the file being replaced
+    try:
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+    except FileNotFoundError:
+        os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+def _discard_temp(tmp_path):
+    """Remove a temporary file that will not be used."""
+    try:
+        os.remove(tmp_path)
+    except OSError:
+        pass
+
+def _atomic_write(path, data):
+    """Write bytes to path through a temporary file so readers never see a partial file."""
+    fd, tmp_path = _temp_file_beside(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            # Make the data durable before the rename publishes it
+            f.flush()
+            os.fsync(f.fileno())
+        _replace_with_temp(tmp_path, path)
+    except BaseException:
+        _discard_temp(tmp_path)
+        raise
+
 def save_tasks_to_json(tasks):
     debug_log("Saving tasks to JSON")
-    docs_path = os.path.join(os.getcwd(), 'docs')
-    os.makedirs(docs_path, exist_ok=True)
-    json_path = os.path.join(docs_path, 'sprint.json')
+    os.makedirs(DOCS_PATH, exist_ok=True)
+    json_path = os.path.join(DOCS_PATH, 'sprint.json')
     try:
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(tasks, f, indent=2)
+        # Encode up front so the file gets a single write() instead of one per token
+        _atomic_write(json_path, _json_dumps(tasks, pretty=PRETTY_JSON))
         debug_log(f"Tasks saved to {json_path}")
         return True
     except Exception as e:
         debug_log(f"Error saving tasks: {e}", level='verbose')
         return False
 
+# While batch_updates() is active, saves are deferred and flushed once on exit
+_save_deferred = False
+_save_dirty = False
+
+def _queue_save():
+    """Save the task list, or just mark it dirty inside batch_updates()."""
+    global _save_dirty
+    if _save_deferred:
+        _save_dirty = True
+    else:
+        save_tasks_to_json(get_arcano_tasks())
+
+@contextmanager
+def batch_updates():
+    """Collapse all task-list saves made inside the block into a single write."""
+    global _save_deferred, _save_dirty
+    outer = _save_deferred
+    _save_deferred = True
+    try:
+        yield
+    finally:
+        _save_deferred = outer
+        if not outer and _save_dirty:
+            _save_dirty = False
+            save_tasks_to_json(get_arcano_tasks())
+
 def list_sprint_files():
-    docs_path = os.path.join(os.getcwd(), 'docs')
     files = []
-    if os.path.exists(docs_path):
-        files = [f for f in os.listdir(docs_path) if f.endswith('.json') or f.endswith('.md')]
+    try:
+        with os.scandir(DOCS_PATH) as it:
+            files = [entry.name for entry in it
+                     if entry.name.endswith(('.json', '.md')) and entry.is_file()]
         debug_log(f"Found sprint files: {files}")
+    except FileNotFoundError:
+        pass
     print(json.dumps(files))
 
-# Try to load tasks from any .json, or sprint.md/todo.md if they exist
-loaded_tasks = load_tasks_from_any_json_or_md()
-if loaded_tasks is not None:
-    arcano_tasks = loaded_tasks
+# Tasks are loaded on first use so commands that don't need them skip the docs/ scan
+_tasks_cache = None
+
+# Task lookup table keyed by normalized (stripped, lowercased) task name
+_task_index = {}
+
+def get_arcano_tasks():
+    """Return the active task list, loading it on first call."""
+    global _tasks_cache
+    if _tasks_cache is None:
+        # Try to load tasks from any .json, or sprint.md/todo.md if they exist
+        loaded_tasks = load_tasks_from_any_json_or_md()
+        if loaded_tasks is None:
+            loaded_tasks = [dict(task) for task in DEFAULT_TASKS]
+        _tasks_cache = [task for task in loaded_tasks if _is_task_entry(task)]
+        _rebuild_index()
+    return _tasks_cache
+
+def _is_task_entry(entry):
+    """Return True if entry is a task dict.
+    
+    Task files are only validated by their first entry, so later entries are
+    checked here once, when the list is loaded.
+    """
+    return isinstance(entry, dict) and 'task' in entry
+
+def _rebuild_index():
+    """Rebuild the task lookup table from the loaded task list."""
+    _task_index.clear()
+    for task in _tasks_cache:
+        # Entries typed as something other than a task are not looked up
+        if task.get('type', 'task') != 'task':
+            continue
+        # Only string names can be looked up; others are still listed as-is
+        if not isinstance(task['task'], str):
+            continue
+        # setdefault keeps the first task on duplicate names, like a linear scan would
+        _task_index.setdefault(task['task'].strip().lower(), task)
+
+def find_task(task_name):
+    """Return the task matching task_name, ignoring case and surrounding whitespace."""
+    get_arcano_tasks()
+    return _task_index.get(task_name.strip().lower())
 
 def start_task(task_name):
     debug_log(f"Starting task: {task_name}")
-    matched = False
-    for task in arcano_tasks:
-        if task['task'] == task_name:
-            task['done'] = False
-            task['started_at'] = datetime.now().isoformat()
-            matched = True
-            print(f"▶️ Started task: {task_name}")
-            save_tasks_to_json(arcano_tasks)
-            break
-    
-    if not matched:
+    task = find_task(task_name)
+    if task is None:
         print(f"❌ Task not found: {task_name}")
+        return
+    
+    task['done'] = False
+    task['started_at'] = datetime.now().isoformat()
+    print(f"▶️ Started task: {task_name}")
+    _queue_save()
 
 def run_sprint(sprint_name):
     debug_log(f"Running sprint: {sprint_name}")
     print(f"\n▶️ Running {sprint_name}...")
-    changed = False
-    for task in arcano_tasks:
+    # Listing the open tasks doesn't modify them, so there is nothing to save
+    for task in get_arcano_tasks():
         if not task['done']:
             print(f"⏳ Working on: {task['task']}")
             # In debug mode, add details about the task
@@ -127,39 +339,29 @@ def run_sprint(sprint_name):
                 print(f"   - Status: {'✓ Done' if task['done'] else '⏳ In progress'}")
                 if 'started_at' in task:
                     print(f"   - Started: {task['started_at']}")
-            changed = True
-    
-    if changed:
-        save_tasks_to_json(arcano_tasks)
     
     print("\nSprint complete.")
 
 def mark_task_done(task_name):
     debug_log(f"Marking task as done: {task_name}")
-    for task in arcano_tasks:
-        if task['task'] == task_name:
-            task['done'] = True
-            task['completed_at'] = datetime.now().isoformat()
-            print(f"✅ Task completed: {task_name}")
-            save_tasks_to_json(arcano_tasks)
-            return
+    task = find_task(task_name)
+    if task is None:
+        print(f"❌ Task not found: {task_name}")
+        return
     
-    print(f"❌ Task not found: {task_name}")
+    task['done'] = True
+    task['completed_at'] = datetime.now().isoformat()
+    print(f"✅ Task completed: {task_name}")
+    _queue_save()
 
 def show_status():
     debug_log("Showing sprint status")
-    completed = [t for t in arcano_tasks if t['done']]
-    pending = [t for t in arcano_tasks if not t['done']]
-
-    print("\n📊 Sprint Progress Summary:")
-    print(f"✅ Completed: {len(completed)}")
-    print(f"🕐 Pending: {len(pending)}")
-
-    # In debug mode, add more details
-    if DEBUG_MODE:
-        print("\n==== DETAILED STATUS ====")
-    
-    for task in arcano_tasks:
+    # Count and format in a single pass over the task list
+    done_count = 0
+    task_lines = []
+    for task in get_arcano_tasks():
+        if task['done']:
+            done_count += 1
         status = "✅" if task['done'] else "⏳"
         details = ""
         if DEBUG_MODE and 'started_at' in task:
@@ -167,7 +369,75 @@ def show_status():
         if DEBUG_MODE and task['done'] and 'completed_at' in task:
             details += f" (Completed: {task['completed_at']})"
         
-        print(f"{status} {task['task']}{details}")
+        task_lines.append(f"{status} {task['task']}{details}")
+
+    # Collect the report and emit it with one write instead of a print per task
+    lines = [
+        "\n📊 Sprint Progress Summary:",
+        f"✅ Completed: {done_count}",
+        f"🕐 Pending: {len(task_lines) - done_count}",
+    ]
+
+    # In debug mode, add more details
+    if DEBUG_MODE:
+        lines.append("\n==== DETAILED STATUS ====")
+    
+    lines.extend(task_lines)
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def _rewrite_markdown_tasks(file_path, targets):
+    """Set task checkboxes in a markdown file.
+    
+    targets maps normalized (stripped, lowercased) task text to its new done
+    state. A temporary file is only created once a line actually changes; it
+    then receives the rest of the file and replaces it. Returns True if a
+    line changed.
+    """
+    import shutil
+    remaining = dict(targets)
+    # Lines read before the first change; only written out if one happens
+    pending = []
+    dst = None
+    tmp_path = None
+    try:
+        # newline='' keeps CRLF line endings intact on the way back out
+        with open(file_path, 'r', encoding='utf-8', newline='') as src:
+            for line in src:
+                match = _TASK_LINE_RE.match(line)
+                done = remaining.pop(match.group(3).strip().lower(), None) if match else None
+                if done is not None:
+                    mark = 'x' if done else ' '
+                    if match.group(2) != mark:
+                        # Only the checkbox changes; indentation and line ending are kept
+                        line = f"{line[:match.start(2)]}{mark}{line[match.end(2):]}"
+                        if dst is None:
+                            fd, tmp_path = _temp_file_beside(file_path)
+                            dst = os.fdopen(fd, 'w', encoding='utf-8', newline='')
+                            dst.writelines(pending)
+                            pending = None
+                if dst is None:
+                    pending.append(line)
+                else:
+                    dst.write(line)
+                if not remaining:
+                    # Task names are unique, so the rest can be copied verbatim
+                    if dst is not None:
+                        shutil.copyfileobj(src, dst)
+                    break
+        if dst is None:
+            # Nothing changed, so the file was only read
+            return False
+        with dst:
+            dst.flush()
+            os.fsync(dst.fileno())
+        _replace_with_temp(tmp_path, file_path)
+    except BaseException:
+        if dst is not None:
+            dst.close()
+        if tmp_path is not None:
+            _discard_temp(tmp_path)
+        raise
+    return True
 
 def update_markdown_task(file_path, task_text, new_status):
     """Update a task's status in a markdown file."""
@@ -175,91 +445,118 @@ def update_markdown_task(file_path, task_text, new_status):
     if not os.path.exists(file_path):
         debug_log(f"File not found: {file_path}")
         return False
-        
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        
-    # Escape special regex characters in the task text
-    escaped_task = re.escape(task_text)
-    
-    # Pattern to match the task line, capturing any indentation and handling Windows line endings
-    # This pattern will match the task regardless of indentation or section
-    pattern = r'(\r?\n|\A)(\s*)- \[([ x])\] ' + escaped_task + r'(\r?\n|\Z)'
-    
-    # Replace with new status
-    mark = 'x' if new_status else ' '
-    replacement = r'\1\2- [' + mark + r'] ' + task_text + r'\4'
     
-    updated_content = re.sub(pattern, replacement, content)
-    
-    if content == updated_content:
+    if not _rewrite_markdown_tasks(file_path, {task_text.strip().lower(): new_status}):
         debug_log(f"Task not found in {file_path}")
         return False
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(updated_content)
-    
     debug_log(f"Task updated in {file_path}")
     return True
 
 def toggle_task_status(task_name):
     debug_log(f"Toggling task status: {task_name}")
-    for task in arcano_tasks:
-        if task['task'] == task_name:
-            task['done'] = not task['done']
-            if task['done']:
-                task['completed_at'] = datetime.now().isoformat()
-                print(f"✅ Task completed: {task_name}")
-            else:
-                task['started_at'] = datetime.now().isoformat()
-                print(f"▶️ Task reopened: {task_name}")
-            save_tasks_to_json(arcano_tasks)
-            
-            # Try to update any markdown files as well
-            docs_path = os.path.join(os.getcwd(), 'docs')
-            if os.path.exists(docs_path):
-                for md_file in ['sprint.md', 'todo.md']:
-                    md_path = os.path.join(docs_path, md_file)
-                    if os.path.exists(md_path):
-                        update_markdown_task(md_path, task_name, task['done'])
-            return
+    task = find_task(task_name)
+    if task is None:
+        print(f"❌ Task not found: {task_name}")
+        return
     
-    print(f"❌ Task not found: {task_name}")
+    toggle_tasks_bulk([(task_name, not task['done'])])
+
+def toggle_tasks_bulk(updates):
+    """Set the status of several tasks at once.
+    
+    updates is a list of (task_name, done) pairs. The task list is saved once
+    and sprint.md/todo.md are each read and written at most once.
+    """
+    debug_log(f"Updating {len(updates)} task(s)")
+    changed = []
+    for task_name, done in updates:
+        task = find_task(task_name)
+        if task is None:
+            print(f"❌ Task not found: {task_name}")
+            continue
+        
+        task['done'] = done
+        if done:
+            task['completed_at'] = datetime.now().isoformat()
+            print(f"✅ Task completed: {task_name}")
+        else:
+            task['started_at'] = datetime.now().isoformat()
+            print(f"▶️ Task reopened: {task_name}")
+        changed.append((task['task'], done))
+    
+    if not changed:
+        return
+    _queue_save()
+    
+    # Try to update any markdown files as well, one line pass per file
+    targets = {task_text.strip().lower(): done for task_text, done in changed}
+    for md_file in ['sprint.md', 'todo.md']:
+        md_path = os.path.join(DOCS_PATH, md_file)
+        # Opening directly saves a separate exists() stat per file
+        try:
+            if _rewrite_markdown_tasks(md_path, targets):
+                debug_log(f"Tasks updated in {md_path}")
+        except FileNotFoundError:
+            continue
 
 def debug_task_details(task_name):
     """Show detailed debug information for a specific task"""
+    import mmap
     debug_log(f"Getting debug details for task: {task_name}")
-    for task in arcano_tasks:
-        if task['task'] == task_name:
-            print(f"\n🔍 DEBUG DETAILS FOR TASK: {task_name}")
-            print(f"Status: {'✅ Done' if task['done'] else '⏳ In progress'}")
-            
-            # Print all task properties
-            for key, value in task.items():
-                if key != 'task':
-                    print(f"{key}: {value}")
-            
-            # Check for related files
-            docs_path = os.path.join(os.getcwd(), 'docs')
-            if os.path.exists(docs_path):
-                related_files = []
-                for file in os.listdir(docs_path):
-                    file_path = os.path.join(docs_path, file)
-                    if os.path.isfile(file_path):
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if task_name in content:
-                                    related_files.append(file)
-                        except Exception as e:
-                            debug_log(f"Error reading file {file}: {e}", level='verbose')
-                            pass
-                
-                if related_files:
-                    print(f"Related files: {', '.join(related_files)}")
-            return
-    
-    print(f"❌ Task not found: {task_name}")
+    task = find_task(task_name)
+    if task is None:
+        print(f"❌ Task not found: {task_name}")
+        return
+    
+    print(f"\n🔍 DEBUG DETAILS FOR TASK: {task['task']}")
+    print(f"Status: {'✅ Done' if task['done'] else '⏳ In progress'}")
+    
+    # Print all task properties
+    for key, value in task.items():
+        if key != 'task':
+            print(f"{key}: {value}")
+    
+    # Check for related files
+    try:
+        it = os.scandir(DOCS_PATH)
+    except FileNotFoundError:
+        return
+    
+    related_files = []
+    # Search the raw bytes through mmap so files are never decoded or copied;
+    # use the stored name, since the lookup ignores case and surrounding space
+    needle = task['task'].encode('utf-8')
+    with it:
+        for entry in it:
+            # mmap cannot map empty files, and they cannot match anyway
+            if not entry.is_file() or entry.stat().st_size == 0:
+                continue
+            try:
+                with open(entry.path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(needle) != -1:
+                        related_files.append(entry.name)
+            except Exception as e:
+                debug_log(f"Error reading file {entry.name}: {e}", level='verbose')
+    
+    if related_files:
+        print(f"Related files: {', '.join(related_files)}")
+
+def _read_raw_json_tasks(file_path):
+    """Return a JSON task file's bytes if it holds a task list, else None.
+    
+    The file is decoded with the same checks as _read_json_tasks, so both
+    --file paths accept the same files; only re-encoding the output is skipped.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        if _parse_json_tasks(raw) is not None:
+            return raw.strip()
+    except Exception as e:
+        debug_log(f"Error reading {file_path}: {e}", level='verbose')
+    return None
 
 def load_tasks_from_file(file_path):
     """Load tasks from a specific file and return them as a JSON-compatible object."""
@@ -269,56 +566,17 @@ def load_tasks_from_file(file_path):
         debug_log(f"File not found: {file_path}")
         return []
     
-    tasks = []
-    
     if file_path.lower().endswith('.json'):
         # Load from JSON
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list) and all('task' in item for item in data):
-                    debug_log(f"Loaded tasks from JSON: {file_path}")
-                    return data
-        except Exception as e:
-            debug_log(f"Error reading JSON {file_path}: {e}", level='verbose')
+        data = _read_json_tasks(file_path)
+        if data is not None:
+            debug_log(f"Loaded tasks from JSON: {file_path}")
+            return data
     
     elif file_path.lower().endswith('.md'):
         # Load from Markdown
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            current_section = None
-            
-            for line in content.split('\n'):
-                line = line.strip()
-                
-                # Check for section headers (both ## and ###)
-                section_match = re.match(r'^(##|###)\s+(.+)', line)
-                if section_match:
-                    current_section = section_match.group(2).strip()
-                    header_level = section_match.group(1)
-                    # Add section with flag indicating if it's a header (##) or task group (###)
-                    tasks.append({
-                        "type": "section",
-                        "name": current_section,
-                        "isHeader": header_level == "##"  # True for ##, False for ###
-                    })
-                    continue
-                
-                # Check for task items
-                task_match = re.match(r'^-\s*\[([ x])\]\s*(.+)', line)
-                if task_match:
-                    is_done = task_match.group(1).lower() == 'x'
-                    task_text = task_match.group(2).strip()
-                    
-                    tasks.append({
-                        "type": "task",
-                        "task": task_text,
-                        "done": is_done,
-                        "section": current_section
-                    })
-                    
+            tasks = _parse_markdown_tasks(file_path)
             debug_log(f"Loaded {len(tasks)} items from Markdown: {file_path}")
             return tasks
             
@@ -329,6 +587,15 @@ def load_tasks_from_file(file_path):
     return []
 
 def main():
+    global PRETTY_JSON
+    # The extension lists files on every panel refresh; answer that without
+    # importing argparse and building the full parser
+    if sys.argv[1:] == ['--list-files']:
+        list_sprint_files()
+        return
+    
+    # Deferred along with the other command-specific imports to keep startup cheap
+    import argparse
     parser = argparse.ArgumentParser(description='Arcano Sprint Manager')
     parser.add_argument('--start', help='Start a task')
     parser.add_argument('--done', help='Mark a task as done')
@@ -338,8 +605,11 @@ def main():
     parser.add_argument('--list-files', action='store_true', help='List available sprint files')
     parser.add_argument('--debug-task', help='Show detailed debug information for a task')
     parser.add_argument('--file', help='Load tasks from a specific file and output as JSON')
+    parser.add_argument('--pretty', action='store_true', help='Write sprint.json indented for human editing')
     
     args = parser.parse_args()
+    if args.pretty:
+        PRETTY_JSON = True
     
     if args.start:
         start_task(args.start)
@@ -357,11 +627,16 @@ def main():
         debug_task_details(args.debug_task)
     elif args.file:
         # When called with --file, load tasks from the specified file and output as JSON
-        docs_path = os.path.join(os.getcwd(), 'docs')
-        file_path = os.path.join(docs_path, args.file)
+        file_path = os.path.join(DOCS_PATH, args.file)
         if os.path.exists(file_path):
-            tasks = load_tasks_from_file(file_path)
-            print(json.dumps(tasks))
+            output = None
+            if file_path.lower().endswith('.json'):
+                output = _read_raw_json_tasks(file_path)
+            if output is None:
+                output = _json_dumps(load_tasks_from_file(file_path))
+            # Write the encoded bytes directly; flush first to keep any debug output in order
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output + b'\n')
         else:
             debug_log(f"File not found: {file_path}")
             print("[]")  # Return empty array on error to avoid breaking the UI
@@ -39,6 +39,9 @@ export async function runSprintManager(args: string[]): Promise<string> {
       const proc = spawn(pythonPath, [scriptPath, ...args], { cwd });
       let stdout = '';
       let stderr = '';
+      // Decode as a stream so multi-byte UTF-8 characters split across chunks survive
+      proc.stdout.setEncoding('utf8');
+      proc.stderr.setEncoding('utf8');
       proc.stdout.on('data', data => { stdout += data.toString(); });
       proc.stderr.on('data', data => { stderr += data.toString(); });
       proc.on('close', code => {